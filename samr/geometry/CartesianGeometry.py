@@ -33,6 +33,10 @@ class CartesianGeometry(Geometry):
     * logically rectangular region of space
     * uniform grid spacing in each direction
     """
+    # --- Attributes
+
+    __slots__ = ('_x_lower', '_dx')
+
     # --- Properties
 
     @property
@@ -46,6 +50,10 @@ class CartesianGeometry(Geometry):
     def x_lower(self):
         """
         numpy.ndarray: lower corner of mesh on coarsest level
+
+        Notes
+        -----
+        * x_lower is read-only
         """
         return self._x_lower
 
@@ -53,6 +61,10 @@ class CartesianGeometry(Geometry):
     def dx(self):
         """
         numpy.ndarray: grid spacing on coarsest level
+
+        Notes
+        -----
+        * dx is read-only
         """
         return self._dx
 
@@ -103,7 +115,32 @@ class CartesianGeometry(Geometry):
             raise ValueError("'dx' contains a non-positive value")
 
         # --- Set property and attribute values
+        #
+        #      Geometry objects are immutable, so attributes are set using
+        #      object.__setattr__().
+
+        x_lower = x_lower.astype('float64')
+        dx = dx.astype('float64')
+
+        # make arrays read-only so that geometry can be safely shared
+        x_lower.flags.writeable = False
+        dx.flags.writeable = False
+
+        object.__setattr__(self, '_x_lower', x_lower)
+        object.__setattr__(self, '_dx', dx)
+
+    def __setstate__(self, state):
+        """
+        Restore CartesianGeometry attributes when unpickling.
+
+        Parameters
+        ----------
+        state: tuple
+            (dict, slots) pair of attribute values produced by
+            object.__getstate__()
+        """
+        super().__setstate__(state)
 
-        self._num_dimensions = num_dimensions
-        self._x_lower = x_lower.astype('float64')
-        self._dx = dx.astype('float64')
+        # unpickled arrays are writeable, so make them read-only again
+        self._x_lower.flags.writeable = False
+        self._dx.flags.writeable = False
@@ -37,7 +37,22 @@ class Geometry:
 
     Subclasses of Geometry should manage properties that are specific
     to the mapping of index space to ?? space.
+
+    Geometry objects are immutable after construction, so a single
+    Geometry may be shared by reference (e.g., across all MeshBlocks on
+    a MeshLevel).
+
+    Notes
+    -----
+    * __setattr__() and __delattr__() raise an AttributeError, so
+      subclasses must set their attributes in __init__() using
+      object.__setattr__()
+    * copy.copy() and copy.deepcopy() return the Geometry object itself
     """
+    # --- Attributes
+
+    __slots__ = ('_num_dimensions',)
+
     # --- Properties
 
     @property
@@ -72,5 +87,50 @@ class Geometry:
             raise ValueError("'num_dimensions' is not a positive integer")
 
         # --- Set property and attribute values
+        #
+        #      Geometry objects are immutable, so attributes are set using
+        #      object.__setattr__().
+
+        object.__setattr__(self, '_num_dimensions', num_dimensions)
+
+    def __setattr__(self, name, value):
+        """
+        Prevent modification of Geometry attributes.
+        """
+        raise AttributeError("'{}' object is immutable".
+                             format(type(self).__name__))
+
+    def __delattr__(self, name):
+        """
+        Prevent deletion of Geometry attributes.
+        """
+        raise AttributeError("'{}' object is immutable".
+                             format(type(self).__name__))
 
-        self._num_dimensions = num_dimensions
+    def __copy__(self):
+        """
+        Return Geometry object (immutable objects do not need to be copied).
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        Return Geometry object (immutable objects do not need to be copied).
+        """
+        return self
+
+    def __setstate__(self, state):
+        """
+        Restore Geometry attributes when unpickling.
+
+        Parameters
+        ----------
+        state: tuple
+            (dict, slots) pair of attribute values produced by
+            object.__getstate__()
+        """
+        dict_state, slots_state = state
+        for attributes in (dict_state, slots_state):
+            if attributes:
+                for name, value in attributes.items():
+                    object.__setattr__(self, name, value)
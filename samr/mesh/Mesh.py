@@ -16,7 +16,7 @@ contained in the LICENSE file.
 # Standard library
 
 # XYZ
-from samr.geometry import MeshGeometry
+from samr.geometry import Geometry
 from samr.mesh import MeshLevel
 
 # --- Constants
@@ -28,6 +28,10 @@ class Mesh:
     """
     TODO
     """
+    # --- Attributes
+
+    __slots__ = ('_levels', 'geometry')
+
     # --- Properties
 
     @property
@@ -42,14 +46,14 @@ class Mesh:
         """
         list: MeshBlocks in Mesh
         """
-        num_levels = len(self.levels)
+        num_levels = len(self._levels)
         if num_levels == 0:
             raise RuntimeError("Mesh contains no blocks.")
         elif num_levels > 1:
             raise RuntimeError("'blocks' is unavailable when for "
                                "multi-level meshes")
 
-        return self.levels.blocks
+        return self._levels[0].blocks
 
     # --- Public methods
 
@@ -59,7 +63,7 @@ class Mesh:
 
         Parameters
         ----------
-        geometry: MeshGeometry object
+        geometry: Geometry object
             TODO
 
         Examples
@@ -68,8 +72,8 @@ class Mesh:
         """
         # --- Check arguments
 
-        if not isinstance(geometry, MeshGeometry):
-            raise ValueError("'geometry' is not a MeshGeometry object")
+        if not isinstance(geometry, Geometry):
+            raise ValueError("'geometry' is not a Geometry object")
 
         # --- Set property and attribute values
 
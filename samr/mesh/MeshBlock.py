@@ -24,9 +24,12 @@ from samr.geometry import Geometry
 
 # --- Constants
 
-# numpy integer data types
-_NUMPY_INT_DTYPES = [numpy.int_, numpy.intc, numpy.intp,
-                     numpy.int8, numpy.int16, numpy.int32, numpy.int64]
+# valid initialization modes for data arrays
+_DATA_INIT_MODES = ('zeros', 'empty')
+
+# alignment (in bytes) of data arrays. 64 bytes is the cache line size and
+# the width of AVX-512 registers on common architectures.
+_DATA_ALIGNMENT = 64
 
 
 # --- Class definition
@@ -34,7 +37,18 @@ _NUMPY_INT_DTYPES = [numpy.int_, numpy.intc, numpy.intp,
 class MeshBlock:
     """
     TODO
+
+    Notes
+    -----
+    * argument type checks in __init__() are disabled when Python is run
+      with optimizations enabled (python -O)
     """
+    # --- Attributes
+
+    __slots__ = ('_num_dimensions', '_lower', '_upper', '_shape',
+                 '_shape_tuple', '_size', '_geometry', '_data_init',
+                 '_data')
+
     # --- Properties
 
     @property
@@ -42,7 +56,7 @@ class MeshBlock:
         """
         int: dimensionality of index space
         """
-        return self._geometry.num_dimensions
+        return self._num_dimensions
 
     @property
     def lower(self):
@@ -52,6 +66,7 @@ class MeshBlock:
         Notes
         -----
         * lower.dtype = 'int64'
+        * lower is a read-only copy of the 'lower' argument to __init__()
         """
         return self._lower
 
@@ -63,9 +78,33 @@ class MeshBlock:
         Notes
         -----
         * upper.dtype = 'int64'
+        * upper is a read-only copy of the 'upper' argument to __init__()
         """
         return self._upper
 
+    @property
+    def shape(self):
+        """
+        numpy.ndarray: number of cells in each coordinate direction
+
+        Notes
+        -----
+        * shape.dtype = 'int64'
+        * shape is computed once at construction and is read-only
+        """
+        return self._shape
+
+    @property
+    def size(self):
+        """
+        int: number of cells in MeshBlock
+
+        Notes
+        -----
+        * size is computed once at construction
+        """
+        return self._size
+
     @property
     def geometry(self):
         """
@@ -73,11 +112,29 @@ class MeshBlock:
         """
         return self._geometry
 
+    @property
+    def variables(self):
+        """
+        list: MeshVariables defined on MeshBlock
+
+        Notes
+        -----
+        * variables is a new list (in the order that variables were added)
+          each time it is accessed, so modifying it does not affect the
+          MeshBlock
+        """
+        return list(self._data_init)
+
     @property
     def data(self):
         """
         dict: mapping from MeshVariables to numpy arrays containing
               data values
+
+        Notes
+        -----
+        * only contains MeshVariables whose data has been allocated (see
+          get_data())
         """
         return self._data
 
@@ -90,7 +147,8 @@ class MeshBlock:
         Parameters
         ----------
         geometry: BlockGeometry
-            geometry of MeshBlock
+            geometry of MeshBlock. Geometry objects are immutable, so
+            'geometry' is stored by reference (not copied).
 
         lower: numpy.ndarray of integers
             lower corner of index space covered by MeshBlock
@@ -102,72 +160,214 @@ class MeshBlock:
         --------
         TODO
         """
-        # --- Check arguments
+        # --- Check argument types
+        #
+        #      Type checks are skipped when Python is run with
+        #      optimizations enabled (python -O).
 
-        # geometry
-        if not isinstance(geometry, Geometry):
-            raise ValueError("'geometry' is not Geometry object")
+        if __debug__:
+            # geometry
+            if not isinstance(geometry, Geometry):
+                raise ValueError("'geometry' is not Geometry object")
+
+            # lower
+            if not isinstance(lower, numpy.ndarray):
+                raise ValueError("'lower' is not a numpy.ndarray")
+
+            # upper
+            if not isinstance(upper, numpy.ndarray):
+                raise ValueError("'upper' is not a numpy.ndarray")
+
+        # --- Check argument values
 
         # get dimensionality of geometry
         num_dimensions = geometry.num_dimensions
 
         # lower
-        if not isinstance(lower, numpy.ndarray):
-            raise ValueError("'lower' is not a numpy.ndarray")
-
         if len(lower) != num_dimensions:
             err_msg = "'lower' does not have 'num_dimensions' components"
             raise ValueError(err_msg)
 
-        if lower.dtype not in _NUMPY_INT_DTYPES:
+        if not numpy.issubdtype(lower.dtype, numpy.signedinteger):
             err_msg = "'lower' does not have an integer dtype"
             raise ValueError(err_msg)
 
         # upper
-        if not isinstance(upper, numpy.ndarray):
-            raise ValueError("'upper' is not a numpy.ndarray")
-
         if len(upper) != num_dimensions:
             err_msg = "'upper' does not have 'num_dimensions' components"
             raise ValueError(err_msg)
 
-        if upper.dtype not in _NUMPY_INT_DTYPES:
+        if not numpy.issubdtype(upper.dtype, numpy.signedinteger):
             err_msg = "'upper' does not have an integer dtype"
             raise ValueError(err_msg)
 
         # --- Set property and attribute values
 
         # PYLINT: eliminate 'defined outside __init__' error
+        self._data_init = {}
         self._data = {}
 
         # index space
+        self._num_dimensions = num_dimensions
         self._lower = lower.astype('int64')
+        self._lower.flags.writeable = False
         self._upper = upper.astype('int64')
+        self._upper.flags.writeable = False
+
+        # shape (upper corner is inclusive)
+        self._shape = self._upper - self._lower + 1
+
+        # shape must be non-negative. The check is performed on the int64
+        # shape so that it is not affected by overflow in the dtype of the
+        # 'lower' and 'upper' arguments.
+        if numpy.any(self._shape < 0):
+            raise ValueError("'upper' is less than 'lower' - 1")
+
+        self._shape.flags.writeable = False
+        self._shape_tuple = tuple(int(n) for n in self._shape)
+        self._size = int(self._shape.prod())
 
         # geometry
         self._geometry = geometry
 
-    def add_variable(self, mesh_variable):
+    def add_variable(self, mesh_variable, init='zeros'):
         """
-        TODO
+        Add MeshVariable to MeshBlock.
+
+        Data for the variable is not allocated until it is first accessed
+        via get_data(). If 'mesh_variable' is already defined on the
+        MeshBlock, its data is discarded.
+
+        Parameters
+        ----------
+        mesh_variable: MeshVariable
+            variable to add to MeshBlock
+
+        init: str
+            initialization of data array when it is allocated.
+            Valid values: 'zeros' (initialize to zero), 'empty' (leave
+            uninitialized; use only when all values will be set before
+            they are read).
         """
-        # Construct data array for variable
-        data = numpy.array(1)
+        # --- Check arguments
 
-        # Set data for variable
-        self._data[mesh_variable] = data
+        if init not in _DATA_INIT_MODES:
+            raise ValueError("'init' does not equal 'zeros' or 'empty'")
+
+        # --- Add variable
+
+        # '_data_init' has an entry for every variable defined on the
+        # MeshBlock (in the order that variables were added), so it is the
+        # single record of the variables defined on the MeshBlock
+        self._data_init[mesh_variable] = init
+
+        # Discard any previously allocated data for variable
+        self._data.pop(mesh_variable, None)
 
     def get_data(self, mesh_variable):
         """
-        TODO
+        Get data for MeshVariable, allocating it on first access.
+
+        Parameters
+        ----------
+        mesh_variable: MeshVariable
+            variable to get data for
+
+        Return values
+        -------------
+        data: numpy.ndarray
+            data array for 'mesh_variable'. The data array has the same
+            shape as the MeshBlock, has the dtype of 'mesh_variable' and
+            is initialized as specified by the 'init' argument to
+            add_variable() when it is allocated.
+
+        Notes
+        -----
+        * data arrays are allocated in C (row-major) order, so they are
+          C-contiguous
+        * data arrays are aligned to 64-byte boundaries
         """
         # --- Check arguments
 
-        if mesh_variable not in self.data:
+        if mesh_variable not in self._data_init:
             err_msg = "'mesh_variable' (={}) not defined on MeshBlock". \
                 format(mesh_variable)
             raise ValueError(err_msg)
 
         # --- Return data
 
-        return self.data[mesh_variable]
+        # Allocate data on first access
+        if mesh_variable not in self._data:
+            self._data[mesh_variable] = self._create_data(mesh_variable)
+
+        return self._data[mesh_variable]
+
+    # --- Private methods
+
+    def _create_data(self, mesh_variable):
+        """
+        Construct data array for MeshVariable.
+
+        Parameters
+        ----------
+        mesh_variable: MeshVariable
+            variable to construct data array for
+
+        Return values
+        -------------
+        data: numpy.ndarray
+            C-contiguous array with the same shape as the MeshBlock and
+            the dtype of 'mesh_variable'. The data buffer is aligned to
+            _DATA_ALIGNMENT bytes.
+        """
+        return _aligned_array(self._shape_tuple, mesh_variable.dtype,
+                              self._data_init[mesh_variable])
+
+
+# --- Helper functions
+
+def _aligned_array(shape, dtype, init):
+    """
+    Construct C-contiguous array whose data buffer is aligned to
+    _DATA_ALIGNMENT bytes.
+
+    Parameters
+    ----------
+    shape: tuple of ints
+        shape of array
+
+    dtype: numpy.dtype
+        data type of array
+
+    init: str
+        initialization of array. Valid values: 'zeros', 'empty'.
+
+    Return values
+    -------------
+    array: numpy.ndarray
+        view into an over-allocated byte buffer that starts at an aligned
+        address
+    """
+    # --- Check arguments
+
+    if any(n < 0 for n in shape):
+        raise ValueError("'shape' contains a negative dimension")
+
+    # --- Construct array
+
+    dtype = numpy.dtype(dtype)
+    nbytes = dtype.itemsize
+    for n in shape:
+        nbytes *= n
+
+    # Allocate byte buffer with room to shift the start of the array to an
+    # aligned address. numpy.zeros() is used for 'zeros' so that the
+    # buffer benefits from lazily zeroed pages.
+    if init == 'empty':
+        buffer = numpy.empty(nbytes + _DATA_ALIGNMENT, dtype=numpy.uint8)
+    else:
+        buffer = numpy.zeros(nbytes + _DATA_ALIGNMENT, dtype=numpy.uint8)
+
+    offset = -buffer.ctypes.data % _DATA_ALIGNMENT
+
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
@@ -27,12 +27,16 @@ class MeshLevel:
     """
     TODO
     """
+    # --- Attributes
+
+    __slots__ = ('_blocks',)
+
     # --- Properties
 
     @property
     def blocks(self):
         """
-        list: MeshBlocks in Mesh
+        list: MeshBlocks in MeshLevel
         """
         return self._blocks
 
@@ -55,4 +59,4 @@ class MeshLevel:
         # --- Set property and attribute values
 
         # PYLINT: eliminate 'defined outside __init__' error
-        self._blocks = None
+        self._blocks = []
@@ -23,6 +23,13 @@ from samr.mesh import Mesh
 
 # --- Constants
 
+# numpy data types for supported floating-point precisions
+_PRECISION_DTYPES = {
+    'double': numpy.dtype(numpy.float64),
+    'single': numpy.dtype(numpy.float32),
+    'half': numpy.dtype(numpy.float16),
+}
+
 
 # --- Class definition
 
@@ -30,6 +37,10 @@ class MeshVariable:
     """
     TODO
     """
+    # --- Attributes
+
+    __slots__ = ('_mesh', '_dtype')
+
     # --- Properties
 
     @property
@@ -59,7 +70,13 @@ class MeshVariable:
 
         precision: str
             floating-point precision for MeshVariable.
-            Valid values: 'double', 'single'.
+            Valid values: 'double', 'single', 'half'.
+
+        Notes
+        -----
+        * 'half' precision halves the memory traffic of 'single' precision
+          for bandwidth-bound sweeps. Numerical schemes that use it must
+          tolerate reduced precision and range.
 
         Examples
         --------
@@ -70,14 +87,13 @@ class MeshVariable:
         if not isinstance(mesh, Mesh):
             raise ValueError("'mesh' is not a Mesh object")
 
-        if precision not in ['double', 'single']:
-            raise ValueError("'precision' does not equal 'double' or 'single'")
+        if not isinstance(precision, str) or \
+                precision not in _PRECISION_DTYPES:
+            err_msg = "'precision' does not equal 'double', 'single' or " \
+                      "'half'"
+            raise ValueError(err_msg)
 
         # --- Set property and attribute values
 
         self._mesh = mesh
-
-        if precision == 'double':
-            self._dtype = numpy.float64
-        else:
-            self._dtype = numpy.float32
+        self._dtype = _PRECISION_DTYPES[precision]
@@ -14,6 +14,8 @@ contained in the LICENSE file.
 # --- Imports
 
 # Standard library
+import copy
+import pickle
 import unittest
 
 # External packages
@@ -60,6 +62,10 @@ class CartesianGeometryTests(unittest.TestCase):
         assert numpy.array_equal(geometry.dx, dx)
         assert geometry.dx.dtype == numpy.float64
 
+        # geometry arrays are read-only
+        assert not geometry.x_lower.flags.writeable
+        assert not geometry.dx.flags.writeable
+
     @staticmethod
     def test_init_2():
         """
@@ -192,3 +198,67 @@ class CartesianGeometryTests(unittest.TestCase):
         if exc_info:
             expected_error = "'dx' contains a non-positive value"
         assert expected_error in str(exc_info)
+
+    @staticmethod
+    def test_immutable():
+        """
+        Test that CartesianGeometry objects are immutable.
+        """
+        # --- Preparations
+
+        num_dimensions = 3
+        x_lower = numpy.zeros(num_dimensions)
+        dx = 0.1 * numpy.ones(num_dimensions)
+        geometry = CartesianGeometry(num_dimensions, x_lower, dx)
+
+        # --- Exercise functionality and check results
+
+        # replace attributes
+        for name in ['_num_dimensions', '_x_lower', '_dx']:
+            with pytest.raises(AttributeError) as exc_info:
+                setattr(geometry, name, None)
+
+            if exc_info:
+                expected_error = "'CartesianGeometry' object is immutable"
+            assert expected_error in str(exc_info)
+
+        # modify array values
+        with pytest.raises(ValueError):
+            geometry.dx[0] = 1.0
+
+        # arguments are copied, so modifying them does not affect geometry
+        x_lower[0] = 1.0
+        assert numpy.array_equal(geometry.x_lower,
+                                 numpy.zeros(num_dimensions))
+
+    @staticmethod
+    def test_copy():
+        """
+        Test copy.copy(), copy.deepcopy() and pickle round trip.
+        """
+        # --- Preparations
+
+        num_dimensions = 3
+        x_lower = numpy.zeros(num_dimensions)
+        dx = 0.1 * numpy.ones(num_dimensions)
+        geometry = CartesianGeometry(num_dimensions, x_lower, dx)
+
+        # --- Exercise functionality and check results
+
+        # copy.copy() and copy.deepcopy() return the same object
+        assert copy.copy(geometry) is geometry
+        assert copy.deepcopy(geometry) is geometry
+
+        # pickle
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            geometry_copy = pickle.loads(pickle.dumps(geometry, protocol))
+            assert geometry_copy.num_dimensions == num_dimensions
+            assert numpy.array_equal(geometry_copy.x_lower, x_lower)
+            assert numpy.array_equal(geometry_copy.dx, dx)
+
+            # unpickled geometry is immutable
+            with pytest.raises(AttributeError):
+                setattr(geometry_copy, '_dx', None)
+
+            with pytest.raises(ValueError):
+                geometry_copy.dx[0] = 1.0
@@ -14,6 +14,8 @@ contained in the LICENSE file.
 # --- Imports
 
 # Standard library
+import copy
+import pickle
 import unittest
 
 # External packages
@@ -81,3 +83,54 @@ class GeometryTests(unittest.TestCase):
         if exc_info:
             expected_error = "'num_dimensions' is not a positive integer"
         assert expected_error in str(exc_info)
+
+    @staticmethod
+    def test_immutable():
+        """
+        Test that Geometry objects are immutable.
+        """
+        # --- Preparations
+
+        geometry = Geometry(num_dimensions=3)
+
+        # --- Exercise functionality and check results
+
+        # modify existing attribute
+        with pytest.raises(AttributeError) as exc_info:
+            geometry._num_dimensions = 5  # pylint: disable=protected-access
+
+        if exc_info:
+            expected_error = "'Geometry' object is immutable"
+        assert expected_error in str(exc_info)
+        assert geometry.num_dimensions == 3
+
+        # delete attribute
+        with pytest.raises(AttributeError) as exc_info:
+            del geometry._num_dimensions  # pylint: disable=protected-access
+
+        if exc_info:
+            expected_error = "'Geometry' object is immutable"
+        assert expected_error in str(exc_info)
+
+    @staticmethod
+    def test_copy():
+        """
+        Test copy.copy(), copy.deepcopy() and pickle round trip.
+        """
+        # --- Preparations
+
+        geometry = Geometry(num_dimensions=3)
+
+        # --- Exercise functionality and check results
+
+        # copy.copy() and copy.deepcopy() return the same object
+        assert copy.copy(geometry) is geometry
+        assert copy.deepcopy(geometry) is geometry
+
+        # pickle
+        for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+            geometry_copy = pickle.loads(pickle.dumps(geometry, protocol))
+            assert geometry_copy.num_dimensions == 3
+
+            with pytest.raises(AttributeError):
+                setattr(geometry_copy, '_num_dimensions', 5)
@@ -22,7 +22,10 @@ import pytest
 
 # XYZ
 from samr.geometry import CartesianGeometry
+from samr.mesh import Mesh
 from samr.mesh import MeshBlock
+from samr.mesh import MeshVariable
+from samr.mesh.MeshBlock import _aligned_array
 
 
 # --- Tests
@@ -55,14 +58,18 @@ class MeshBlockTests(unittest.TestCase):
         assert hasattr(MeshBlock, 'num_dimensions')
         assert hasattr(MeshBlock, 'lower')
         assert hasattr(MeshBlock, 'upper')
+        assert hasattr(MeshBlock, 'shape')
+        assert hasattr(MeshBlock, 'size')
+        assert hasattr(MeshBlock, 'variables')
+        assert hasattr(MeshBlock, 'data')
 
     def test_init_1(self):
         """
         Test construction of MeshBlock object with valid parameters.
         """
         # Exercise functionality
-        lower = numpy.zeros(self.num_dimensions, dtype='int')
-        upper = numpy.ones(self.num_dimensions, dtype='int')
+        lower = numpy.zeros(self.num_dimensions, dtype='int64')
+        upper = numpy.ones(self.num_dimensions, dtype='int64')
         block = MeshBlock(self.geometry, lower, upper)
 
         # Check results
@@ -71,6 +78,24 @@ class MeshBlockTests(unittest.TestCase):
         assert block.lower.dtype == numpy.int64
         assert numpy.array_equal(block.upper, upper)
         assert block.upper.dtype == numpy.int64
+        assert numpy.array_equal(block.shape, upper - lower + 1)
+        assert block.shape.dtype == numpy.int64
+        assert not block.shape.flags.writeable
+        assert block.size == numpy.prod(upper - lower + 1)
+        assert isinstance(block.size, int)
+
+        # lower and upper are read-only copies of the arguments
+        assert not block.lower.flags.writeable
+        assert not block.upper.flags.writeable
+
+        lower[0] = 1
+        upper[0] = 2
+        assert numpy.array_equal(block.lower,
+                                 numpy.zeros(self.num_dimensions))
+        assert numpy.array_equal(block.upper,
+                                 numpy.ones(self.num_dimensions))
+        assert numpy.array_equal(block.shape,
+                                 2 * numpy.ones(self.num_dimensions))
 
     def test_init_2(self):
         """
@@ -124,6 +149,16 @@ class MeshBlockTests(unittest.TestCase):
                              "components"
         assert expected_error in str(exc_info)
 
+        # lower does not have an integer dtype
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshBlock(geometry=self.geometry,
+                          lower=numpy.zeros(self.num_dimensions),
+                          upper=upper)
+
+        if exc_info:
+            expected_error = "'lower' does not have an integer dtype"
+        assert expected_error in str(exc_info)
+
     def test_init_4(self):
         """
         Test construction of MeshBlock object. Invalid 'upper'
@@ -155,3 +190,138 @@ class MeshBlockTests(unittest.TestCase):
             expected_error = "'upper' does not have 'num_dimensions' " \
                              "components"
         assert expected_error in str(exc_info)
+
+        # upper does not have an integer dtype
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshBlock(geometry=self.geometry,
+                          lower=lower,
+                          upper=numpy.ones(self.num_dimensions))
+
+        if exc_info:
+            expected_error = "'upper' does not have an integer dtype"
+        assert expected_error in str(exc_info)
+
+        # upper < lower - 1
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshBlock(geometry=self.geometry,
+                          lower=lower,
+                          upper=numpy.array([-2, 1, 2]))
+
+        if exc_info:
+            expected_error = "'upper' is less than 'lower' - 1"
+        assert expected_error in str(exc_info)
+
+        # upper = lower - 1 (empty block) is valid
+        block = MeshBlock(geometry=self.geometry,
+                          lower=lower,
+                          upper=numpy.array([-1, 1, 2]))
+        assert block.size == 0
+
+        # 'lower' - 1 overflows the dtype of the arguments
+        block = MeshBlock(geometry=self.geometry,
+                          lower=numpy.array([-128, 0, 0], dtype='int8'),
+                          upper=numpy.array([0, 0, 0], dtype='int8'))
+        assert numpy.array_equal(block.shape, [129, 1, 1])
+
+    def test_add_variable(self):
+        """
+        Test add_variable() and get_data().
+        """
+        # --- Preparations
+
+        lower = numpy.zeros(self.num_dimensions, dtype='int')
+        upper = numpy.array([1, 2, 3])
+        block = MeshBlock(self.geometry, lower, upper)
+
+        mesh = Mesh(self.geometry)
+        mesh_variable = MeshVariable(mesh, precision='single')
+
+        # --- Exercise functionality and check results
+
+        # add_variable() does not allocate data
+        block.add_variable(mesh_variable)
+        assert mesh_variable in block.variables
+        assert mesh_variable not in block.data
+
+        # adding a variable twice does not duplicate it
+        block.add_variable(mesh_variable)
+        assert block.variables == [mesh_variable]
+
+        # modifying 'variables' does not affect the MeshBlock
+        other_variable = MeshVariable(mesh)
+        block.variables.append(other_variable)
+        assert block.variables == [mesh_variable]
+
+        # get_data() allocates data on first access
+        data = block.get_data(mesh_variable)
+        assert mesh_variable in block.data
+        assert block.get_data(mesh_variable) is data
+
+        assert data.shape == (2, 3, 4)
+        assert data.dtype == numpy.float32
+        assert numpy.all(data == 0)
+        assert data.flags['C_CONTIGUOUS']
+        assert data.ctypes.data % 64 == 0
+
+        # get_data() for variable not defined on MeshBlock
+        with pytest.raises(ValueError) as exc_info:
+            _ = block.get_data(MeshVariable(mesh))
+
+        if exc_info:
+            expected_error = "not defined on MeshBlock"
+        assert expected_error in str(exc_info)
+
+    def test_add_variable_init(self):
+        """
+        Test add_variable(). 'init' argument
+        """
+        # --- Preparations
+
+        lower = numpy.zeros(self.num_dimensions, dtype='int')
+        upper = numpy.array([1, 2, 3])
+        block = MeshBlock(self.geometry, lower, upper)
+
+        mesh = Mesh(self.geometry)
+        mesh_variable = MeshVariable(mesh)
+
+        # --- Exercise functionality and check results
+
+        # init='empty'
+        block.add_variable(mesh_variable, init='empty')
+        data = block.get_data(mesh_variable)
+        assert data.shape == (2, 3, 4)
+        assert data.dtype == numpy.float64
+        assert data.flags['C_CONTIGUOUS']
+        assert data.ctypes.data % 64 == 0
+
+        # invalid 'init'
+        with pytest.raises(ValueError) as exc_info:
+            block.add_variable(mesh_variable, init='ones')
+
+        if exc_info:
+            expected_error = "'init' does not equal 'zeros' or 'empty'"
+        assert expected_error in str(exc_info)
+
+    @staticmethod
+    def test_aligned_array():
+        """
+        Test _aligned_array() helper function.
+        """
+        # --- Exercise functionality and check results
+
+        # valid shape
+        for init in ['zeros', 'empty']:
+            array = _aligned_array((2, 3, 4), numpy.float64, init)
+            assert array.shape == (2, 3, 4)
+            assert array.dtype == numpy.float64
+            assert array.flags['C_CONTIGUOUS']
+            assert array.ctypes.data % 64 == 0
+
+        # shape contains negative dimensions
+        for shape in [(-1, 2, 3), (-1, -1, -1)]:
+            with pytest.raises(ValueError) as exc_info:
+                _ = _aligned_array(shape, numpy.float64, 'zeros')
+
+            if exc_info:
+                expected_error = "'shape' contains a negative dimension"
+            assert expected_error in str(exc_info)
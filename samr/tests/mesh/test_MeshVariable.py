@@ -18,9 +18,12 @@ import unittest
 
 # External packages
 import numpy
+import pytest
 
 # XYZ
-from samr import MeshVariable
+from samr.geometry import CartesianGeometry
+from samr.mesh import Mesh
+from samr.mesh import MeshVariable
 
 
 # --- Tests
@@ -29,6 +32,18 @@ class MeshVariableTests(unittest.TestCase):
     """
     Unit tests for MeshVariable class.
     """
+    # --- setUp/tearDown
+
+    def setUp(self):
+        """
+        Set up test fixtures.
+        """
+        num_dimensions = 3
+        x_lower = numpy.zeros(num_dimensions)
+        dx = 0.1*numpy.ones(num_dimensions)
+        geometry = CartesianGeometry(num_dimensions, x_lower, dx)
+        self.mesh = Mesh(geometry)
+
     # --- Test cases
 
     @staticmethod
@@ -37,37 +52,94 @@ class MeshVariableTests(unittest.TestCase):
         Test for expected attributes.
         """
         # Properties
+        assert hasattr(MeshVariable, 'mesh')
         assert hasattr(MeshVariable, 'dtype')
 
-    @staticmethod
-    def test_init_1():
+    def test_init_1(self):
         """
         Test construction of MeshVariable object with default parameters.
         """
         # Exercise functionality
-        mesh_variable = MeshVariable()
+        mesh_variable = MeshVariable(self.mesh)
 
         # Check results
+        assert mesh_variable.mesh is self.mesh
         assert mesh_variable.dtype == numpy.float64
 
-    @staticmethod
-    def test_init_2():
+    def test_init_2(self):
         """
         Test construction of MeshVariable object: precision='double'
         """
         # Exercise functionality
-        mesh_variable = MeshVariable(precision='double')
+        mesh_variable = MeshVariable(self.mesh, precision='double')
 
         # Check results
         assert mesh_variable.dtype == numpy.float64
 
-    @staticmethod
-    def test_init_3():
+    def test_init_3(self):
         """
         Test construction of MeshVariable object: precision='single'
         """
         # Exercise functionality
-        mesh_variable = MeshVariable(precision='single')
+        mesh_variable = MeshVariable(self.mesh, precision='single')
 
         # Check results
         assert mesh_variable.dtype == numpy.float32
+
+    def test_init_4(self):
+        """
+        Test construction of MeshVariable object: precision='half'
+        """
+        # Exercise functionality
+        mesh_variable = MeshVariable(self.mesh, precision='half')
+
+        # Check results
+        assert mesh_variable.dtype == numpy.float16
+
+    def test_init_5(self):
+        """
+        Test construction of MeshVariable object. Invalid arguments
+        """
+        # --- Exercise functionality and check results
+
+        # mesh not a Mesh object
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshVariable(mesh='not a Mesh object')
+
+        if exc_info:
+            expected_error = "'mesh' is not a Mesh object"
+        assert expected_error in str(exc_info)
+
+        # invalid precision
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshVariable(self.mesh, precision='quadruple')
+
+        if exc_info:
+            expected_error = "'precision' does not equal 'double', " \
+                             "'single' or 'half'"
+        assert expected_error in str(exc_info)
+
+        # precision not a str (unhashable)
+        with pytest.raises(ValueError) as exc_info:
+            _ = MeshVariable(self.mesh, precision=['double'])
+
+        if exc_info:
+            expected_error = "'precision' does not equal 'double', " \
+                             "'single' or 'half'"
+        assert expected_error in str(exc_info)
+
+    def test_dtype(self):
+        """
+        Test that 'dtype' is a numpy.dtype instance for each precision.
+        """
+        expected_dtypes = {'double': numpy.float64,
+                           'single': numpy.float32,
+                           'half': numpy.float16}
+
+        for precision, expected_dtype in expected_dtypes.items():
+            # Exercise functionality
+            mesh_variable = MeshVariable(self.mesh, precision=precision)
+
+            # Check results
+            assert isinstance(mesh_variable.dtype, numpy.dtype)
+            assert mesh_variable.dtype == expected_dtype